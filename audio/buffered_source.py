@@ -0,0 +1,128 @@
+import logging
+import os
+import threading
+from collections import deque
+
+import discord
+from dotenv import load_dotenv
+
+log = logging.getLogger(__name__)
+
+load_dotenv()
+
+AUDIO_BUFFER_MS = int(os.getenv('AUDIO_BUFFER_MS', 1000))
+
+# One frame is 20ms of 48kHz 16-bit stereo PCM, as expected by the voice sender.
+FRAME_LENGTH_MS = discord.opus.Encoder.FRAME_LENGTH
+FRAME_SIZE = discord.opus.Encoder.FRAME_SIZE
+SILENCE_FRAME = b'\x00' * FRAME_SIZE
+
+
+class BufferedAudioSource(discord.AudioSource):
+    """
+    Wraps a PCM AudioSource and reads it ahead on a dedicated thread into a bounded buffer,
+    so that short stalls of the upstream source (network hiccups, ffmpeg hangs) are absorbed
+    instead of being heard as gaps.
+
+    Playback only starts once half the buffer is filled (or the source ended), so the upstream
+    startup latency is not mistaken for a stall. When the buffer runs dry mid-playback, an underrun
+    is counted once and the buffer primes again before resuming.
+    """
+
+    def __init__(self, source: discord.AudioSource, buffer_ms: int = AUDIO_BUFFER_MS):
+        if source.is_opus():
+            raise ValueError("BufferedAudioSource only supports PCM sources.")
+
+        self.source = source
+        self.capacity = max(1, buffer_ms // FRAME_LENGTH_MS)
+        self.preroll = max(1, self.capacity // 2)
+        self.underruns = 0
+        self.frames_read = 0
+
+        self._buffer = deque()
+        self._condition = threading.Condition()
+        self._finished = False
+        self._closed = False
+        self._priming = True
+
+        self._reader = threading.Thread(target=self._fill, name="BufferedAudioSource reader", daemon=True)
+        self._reader.start()
+
+    @property
+    def fill_level(self) -> int:
+        """Number of frames currently waiting in the buffer."""
+        return len(self._buffer)
+
+    @property
+    def fill_ms(self) -> int:
+        """Amount of buffered audio, in milliseconds."""
+        return len(self._buffer) * FRAME_LENGTH_MS
+
+    @property
+    def seconds_read(self) -> float:
+        """Amount of audio pulled from the wrapped source so far, in seconds."""
+        return self.frames_read * FRAME_LENGTH_MS / 1000
+
+    def _fill(self):
+        """Reader thread: pulls frames from the wrapped source until it ends or the buffer is closed."""
+        try:
+            while True:
+                with self._condition:
+                    while len(self._buffer) >= self.capacity and not self._closed:
+                        self._condition.wait()
+                    if self._closed:
+                        return
+
+                data = self.source.read()
+                if not data:
+                    return
+
+                with self._condition:
+                    self._buffer.append(data)
+                    self.frames_read += 1
+                    self._condition.notify_all()
+        except Exception as e:
+            log.error(f"Buffered audio reader failed: {e}")
+        finally:
+            with self._condition:
+                self._finished = True
+                self._condition.notify_all()
+
+    def read(self) -> bytes:
+        with self._condition:
+            if self._priming:
+                if len(self._buffer) < self.preroll and not self._finished:
+                    return SILENCE_FRAME
+                self._priming = False
+
+            if not self._buffer and not self._finished:
+                # Give the reader one frame's worth of time before declaring an underrun.
+                self._condition.wait(FRAME_LENGTH_MS / 1000)
+
+            if self._buffer:
+                data = self._buffer.popleft()
+                self._condition.notify_all()
+                return data
+
+            if self._finished:
+                return b''
+
+            self.underruns += 1
+            self._priming = True
+            return SILENCE_FRAME
+
+    def is_opus(self) -> bool:
+        return False
+
+    def cleanup(self):
+        # Called both when playback ends and again by AudioSource.__del__.
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._buffer.clear()
+            self._condition.notify_all()
+
+        self.source.cleanup()
+        if self.underruns:
+            log.warning(f"Buffered audio source ended with {self.underruns} underrun(s).")
@@ -0,0 +1,41 @@
+from typing import Optional
+
+import discord
+
+# Matches the default encoder bitrate of VoiceClient.play, anything above it is re-encoded down anyway.
+MAX_TARGET_BITRATE_KBPS = 128
+DEFAULT_TARGET_BITRATE_KBPS = 64
+
+
+def target_bitrate_kbps(channel: Optional[discord.VoiceChannel]) -> int:
+    """Returns the bitrate a stream needs to match what will actually be sent to the given voice channel."""
+    if channel is None or not getattr(channel, "bitrate", None):
+        return DEFAULT_TARGET_BITRATE_KBPS
+    return min(channel.bitrate // 1000, MAX_TARGET_BITRATE_KBPS)
+
+
+def select_format(bitrate_kbps: int) -> str:
+    """
+    Builds a yt-dlp format selector preferring the smallest audio-only Opus format that still meets
+    the target bitrate, then the best Opus one below it, then any audio-only format, and only then
+    formats containing video.
+    """
+    return (
+        f"worstaudio[acodec=opus][abr>={bitrate_kbps}]"
+        f"/bestaudio[acodec=opus]"
+        f"/worstaudio[abr>={bitrate_kbps}]"
+        f"/bestaudio"
+        f"/best"
+    )
+
+
+def estimate_downloaded_bytes(info: dict, seconds: float) -> int:
+    """Estimates how many bytes of the selected format were pulled to play the given number of seconds."""
+    bitrate_kbps = info.get("abr") or info.get("tbr")
+    if not bitrate_kbps:
+        return 0
+    return int(bitrate_kbps * 1000 / 8 * seconds)
+
+
+def format_bytes(size: int) -> str:
+    return f"{size / 1_000_000:.1f} MB"
@@ -5,7 +5,7 @@ import os
 from dotenv import load_dotenv
 from discord.ext import commands
 
-from database.db_connect import create_mariadb_pool
+from database.db_connect import create_mariadb_pool, ensure_music_search_index
 
 load_dotenv()
 TOKEN = os.getenv('DISCORD_TOKEN')
@@ -54,6 +54,12 @@ class DMPlayer(commands.Bot):
         self.db_pool = await asyncio.to_thread(create_mariadb_pool, "bot_pool", 5)
         print("MariaDB pool created")
 
+        try:
+            await asyncio.to_thread(ensure_music_search_index, self.db_pool)
+            print("Music search index ready")
+        except Exception as e:
+            print(f"Failed to create music search index: {e}")
+
         print(f'Logged in as {self.user} (ID: {self.user.id})')
         print("Bot is ready and connected to the server!")
         print('------')
@@ -11,10 +11,12 @@ from discord.ext import commands
 import yt_dlp
 from dotenv import load_dotenv
 
+from audio.buffered_source import BufferedAudioSource
+from audio.stream_format import target_bitrate_kbps, select_format, estimate_downloaded_bytes, format_bytes
+
 log = logging.getLogger(__name__)
 
 YDL_OPTIONS = {
-    "format": "bestaudio/best",
     "noplaylist": True,
     "quiet": True,
     "default_search": "auto",
@@ -84,11 +86,20 @@ class AutoMusicCog(commands.Cog):
 
         return await asyncio.to_thread(_query)
 
-    async def _fade_transition(self, interaction: discord.Interaction, new_source: discord.AudioSource):
+    @staticmethod
+    def _account_streamed_bytes(queue: Dict, source: BufferedAudioSource):
+        """Adds what a playing source streamed to the session total, once per source."""
+        info = queue['playing'].pop(source, None)
+        if info is not None:
+            queue['bytes_downloaded'] += estimate_downloaded_bytes(info, source.seconds_read)
+
+    async def _fade_transition(self, interaction: discord.Interaction, new_source: BufferedAudioSource, info: dict):
         """Handles the smooth transition between two songs."""
         voice_client = interaction.guild.voice_client
         if not voice_client:
+            new_source.cleanup()
             return
+        guild_id = interaction.guild.id
 
         # --- Fade Out ---
         if voice_client.is_playing() and hasattr(voice_client.source, 'volume'):
@@ -101,9 +112,29 @@ class AutoMusicCog(commands.Cog):
         # --- Play new song and Fade In ---
         player = discord.PCMVolumeTransformer(new_source, volume=0.0)
 
-        callback = lambda err: self.bot.loop.create_task(self._play_next_song(interaction)) if not err else log.error(
-            f"Playback error: {err}")
-        voice_client.play(player, after=callback)
+        def callback(err):
+            # Runs on the voice player thread: accounting must never prevent the next song from being scheduled.
+            try:
+                queue = self.queues.get(guild_id)
+                if queue is not None:
+                    self._account_streamed_bytes(queue, new_source)
+            except Exception as e:
+                log.error(f"Failed to account streamed bytes: {e}")
+
+            if err:
+                log.error(f"Playback error: {err}")
+            else:
+                asyncio.run_coroutine_threadsafe(self._play_next_song(interaction), self.bot.loop)
+
+        if guild_id in self.queues:
+            self.queues[guild_id]['playing'][new_source] = info
+        try:
+            voice_client.play(player, after=callback)
+        except Exception:
+            if guild_id in self.queues:
+                self.queues[guild_id]['playing'].pop(new_source, None)
+            new_source.cleanup()
+            raise
 
         for i in range(FADE_STEPS + 1):
             player.volume = DEFAULT_VOLUME * (i / FADE_STEPS)
@@ -115,19 +146,22 @@ class AutoMusicCog(commands.Cog):
             guild_id = interaction.guild.id
             if from_queue and (guild_id not in self.queues or not self.queues[guild_id]['queue']):
                 if guild_id in self.queues:
-                    await self.queues[guild_id]['channel'].send("✅ Queue finished.")
+                    downloaded = format_bytes(self.queues[guild_id]['bytes_downloaded'])
+                    await self.queues[guild_id]['channel'].send(f"✅ Queue finished. Streamed ~{downloaded} this session.")
                     del self.queues[guild_id]
                 return
 
             try:
                 url = self.queues[guild_id]['queue'].popleft()
-                with yt_dlp.YoutubeDL(YDL_OPTIONS) as ydl:
+                voice_client = interaction.guild.voice_client
+                bitrate = target_bitrate_kbps(voice_client.channel if voice_client else None)
+                with yt_dlp.YoutubeDL({**YDL_OPTIONS, "format": select_format(bitrate)}) as ydl:
                     info = ydl.extract_info(url, download=False)
                     audio_url = info.get("url")
                     title = info.get("title", "Unknown Title")
 
-                source = discord.FFmpegPCMAudio(audio_url, **FFMPEG_OPTIONS)
-                await self._fade_transition(interaction, source)
+                source = BufferedAudioSource(discord.FFmpegPCMAudio(audio_url, **FFMPEG_OPTIONS))
+                await self._fade_transition(interaction, source, info)
                 await self.queues[guild_id]['channel'].send(f"▶️ Now playing: **{title}**")
 
             except Exception as e:
@@ -137,6 +171,24 @@ class AutoMusicCog(commands.Cog):
                     # Recursively call to try the next song
                     await self._play_next_song(interaction)
 
+    async def enqueue(self, interaction: discord.Interaction, urls: List[str]):
+        """Connects to the user's voice channel if needed and appends the URLs to the guild queue."""
+        if not interaction.guild.voice_client:
+            await interaction.user.voice.channel.connect()
+
+        guild_id = interaction.guild.id
+        if guild_id not in self.queues:
+            self.queues[guild_id] = {'queue': deque(), 'channel': interaction.channel, 'bytes_downloaded': 0,
+                                     'playing': {}}
+
+        self.queues[guild_id]['queue'].extend(urls)
+
+    async def start_if_idle(self, interaction: discord.Interaction):
+        """Starts the playback loop unless a song is already playing or transitioning."""
+        voice_client = interaction.guild.voice_client
+        if voice_client and not voice_client.is_playing() and not self.transition_lock.locked():
+            await self._play_next_song(interaction)
+
     @app_commands.command(name="auto_play", description="Plays a playlist of music based on a theme and intensity.")
     @app_commands.describe(
         theme="A comma-separated list of themes to match (e.g., 'Combat, Boss').",  # CHANGED
@@ -168,22 +220,13 @@ class AutoMusicCog(commands.Cog):
             await interaction.followup.send(f"A database error occurred: `{e}`", ephemeral=True)
             return
 
-        voice_client = interaction.guild.voice_client
-        if not voice_client:
-            voice_client = await interaction.user.voice.channel.connect()
-
-        guild_id = interaction.guild.id
-        if guild_id not in self.queues:
-            self.queues[guild_id] = {'queue': deque(), 'channel': interaction.channel}
-
-        self.queues[guild_id]['queue'].extend(urls)
+        await self.enqueue(interaction, urls)
 
         # Update confirmation message to show all themes
         theme_str = "', '".join(themes_list)
         await interaction.followup.send(f"✅ Added **{len(urls)}** songs for themes '**{theme_str}**' to the queue.")
 
-        if not voice_client.is_playing() and not self.transition_lock.locked():
-            await self._play_next_song(interaction)
+        await self.start_if_idle(interaction)
 
     @app_commands.command(name="skip", description="Skips the current song and plays the next in the queue.")
     async def skip(self, interaction: discord.Interaction):
@@ -212,16 +255,24 @@ class AutoMusicCog(commands.Cog):
         voice_client = interaction.guild.voice_client
         guild_id = interaction.guild.id
 
+        downloaded = None
         if guild_id in self.queues:
-            self.queues[guild_id]['queue'].clear()
+            queue = self.queues[guild_id]
+            queue['queue'].clear()
+            # The after-callback of the current track will no longer find the queue, count it now.
+            for source in list(queue['playing']):
+                self._account_streamed_bytes(queue, source)
+            downloaded = queue['bytes_downloaded']
             del self.queues[guild_id]
 
         if voice_client:
             if voice_client.is_playing():
                 voice_client.stop()
 
-        await interaction.response.send_message("⏹️ Music stopped, queue cleared.",
-                                                ephemeral=True)
+        message = "⏹️ Music stopped, queue cleared."
+        if downloaded is not None:
+            message += f" Streamed ~{format_bytes(downloaded)} this session."
+        await interaction.response.send_message(message, ephemeral=True)
 
 
 async def setup(bot: commands.Bot):
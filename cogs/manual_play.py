@@ -2,6 +2,7 @@
 import asyncio
 import logging
 import os
+from typing import Dict
 
 import discord
 from discord import app_commands
@@ -9,6 +10,9 @@ from discord.ext import commands
 import yt_dlp
 from dotenv import load_dotenv
 
+from audio.buffered_source import BufferedAudioSource
+from audio.stream_format import target_bitrate_kbps, select_format, estimate_downloaded_bytes, format_bytes
+
 log = logging.getLogger(__name__)
 
 load_dotenv()
@@ -18,6 +22,19 @@ DEFAULT_VOLUME = os.getenv('DEFAULT_VOLUME')
 class ManualMusicCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.sessions: Dict[int, Dict] = {}
+
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState,
+                                    after: discord.VoiceState):
+        """Ends the guild's manual session, and reports what it streamed, once the bot leaves voice."""
+        if member.id != self.bot.user.id or after.channel is not None:
+            return
+
+        session = self.sessions.pop(member.guild.id, None)
+        if session is not None:
+            await session['channel'].send(
+                f"👋 Manual session ended. Streamed ~{format_bytes(session['bytes_downloaded'])} in total.")
 
     @app_commands.command(name="manual_play", description="Plays audio from a YouTube URL in your current voice channel.")
     @app_commands.describe(url="The YouTube URL of the video to play.")
@@ -57,6 +74,11 @@ class ManualMusicCog(commands.Cog):
             await interaction.followup.send(f"Could not connect to voice channel: {e}")
             return
 
+        if guild.id not in self.sessions:
+            self.sessions[guild.id] = {'channel': interaction.channel, 'bytes_downloaded': 0}
+        session = self.sessions[guild.id]
+        session['channel'] = interaction.channel
+
         # 3) STOP currently playing audio (if any)
         try:
             if voice_client.is_playing():
@@ -66,7 +88,7 @@ class ManualMusicCog(commands.Cog):
 
         # 4) FETCH using yt-dlp
         YDL_OPTIONS = {
-            "format": "bestaudio/best",
+            "format": select_format(target_bitrate_kbps(channel)),
             "noplaylist": True,
             "quiet": True,
         }
@@ -94,18 +116,32 @@ class ManualMusicCog(commands.Cog):
             return
 
         # 5) PLAY: create source and play
+        source = None
         try:
-            source = discord.FFmpegPCMAudio(audio_url, **FFMPEG_OPTIONS)
+            source = BufferedAudioSource(discord.FFmpegPCMAudio(audio_url, **FFMPEG_OPTIONS))
             player = discord.PCMVolumeTransformer(source, volume=float(DEFAULT_VOLUME))
 
             # Use after callback to log errors (must be non-async or schedule coroutine)
             def after_play(err):
                 if err:
                     log.error("Error in playback: %s", err)
+                if self.sessions.get(guild.id) is not session:
+                    return
+                try:
+                    session['bytes_downloaded'] += estimate_downloaded_bytes(info, source.seconds_read)
+                except Exception as e:
+                    log.error("Failed to account streamed bytes: %s", e)
+                    return
+                asyncio.run_coroutine_threadsafe(
+                    session['channel'].send(f"⏹️ Finished **{title}**. "
+                                            f"Streamed ~{format_bytes(session['bytes_downloaded'])} this session."),
+                    self.bot.loop)
 
             voice_client.play(player, after=after_play)
         except Exception as e:
             log.exception("Failed to start playback")
+            if source is not None:
+                source.cleanup()
             await interaction.followup.send(f"Failed to play audio: {e}")
             return
 
@@ -1,13 +1,126 @@
 import asyncio
 import logging
+import re
 import discord
 from discord import app_commands
 from discord.ext import commands
-from typing import Tuple, List, Optional
+from typing import Tuple, List, Optional, Dict
 from discord.app_commands import Range
 
 log = logging.getLogger(__name__)
 
+SEARCH_PAGE_SIZE = 10
+# InnoDB ignores FULLTEXT tokens shorter than innodb_ft_min_token_size (3 by default).
+MIN_SEARCH_TOKEN_LENGTH = 3
+
+
+def _search_words(query: str) -> List[str]:
+    return re.findall(r"\w+", query)
+
+
+def _to_boolean_query(query: str) -> str:
+    """Turns free text into a BOOLEAN MODE query where every long enough word must prefix-match."""
+    words = _search_words(query)
+    return " ".join(f"+{w}*" if len(w) >= MIN_SEARCH_TOKEN_LENGTH else f"{w}*" for w in words)
+
+
+class SearchResultsView(discord.ui.View):
+    """Paginated /search_music results, with a menu to enqueue one of the displayed tracks."""
+
+    def __init__(self, cog: "MusicCog", query: str, page: int, total: int, rows: List[Dict]):
+        super().__init__(timeout=180)
+        self.cog = cog
+        self.query = query
+        self.page = page
+        self.total = total
+        self.rows = rows
+        self.message: Optional[discord.Message] = None
+        self._refresh_items()
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-self.total // SEARCH_PAGE_SIZE))
+
+    def build_embed(self) -> discord.Embed:
+        lines = []
+        for i, r in enumerate(self.rows, start=(self.page - 1) * SEARCH_PAGE_SIZE + 1):
+            intensity = r['intensity'] if r['intensity'] is not None else "—"
+            themes = r['themes'] or "no theme"
+            lines.append(f"`{i}` **{r['name']}** — intensity **{intensity}** — {themes}")
+        description = "\n".join(lines) or "No results on this page anymore."
+        embed = discord.Embed(title=f"Search results for '{self.query}'", description=description,
+                              color=discord.Color.blurple())
+        embed.set_footer(text=f"Page {self.page}/{self.page_count} — {self.total} result(s)")
+        return embed
+
+    def _refresh_items(self):
+        self.clear_items()
+
+        # Discord rejects a select menu without options, which happens if the library shrank between pages.
+        if self.rows:
+            select = discord.ui.Select(
+                placeholder="Add a track to the queue...",
+                options=[discord.SelectOption(label=r['name'][:100], value=str(r['id'])) for r in self.rows],
+            )
+            select.callback = self._enqueue_selected
+            self.add_item(select)
+
+        previous_button = discord.ui.Button(label="Previous", style=discord.ButtonStyle.secondary,
+                                            disabled=self.page <= 1)
+        previous_button.callback = self._previous_page
+        self.add_item(previous_button)
+
+        next_button = discord.ui.Button(label="Next", style=discord.ButtonStyle.secondary,
+                                        disabled=self.page >= self.page_count)
+        next_button.callback = self._next_page
+        self.add_item(next_button)
+
+    async def on_timeout(self):
+        for item in self.children:
+            item.disabled = True
+        if self.message is not None:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass
+
+    async def _show_page(self, interaction: discord.Interaction, page: int):
+        try:
+            self.total, self.rows = await self.cog._search_music(self.query, page)
+        except Exception as e:
+            await interaction.response.send_message(f"A database error occurred: `{e}`", ephemeral=True)
+            return
+        self.page = page
+        self._refresh_items()
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+    async def _previous_page(self, interaction: discord.Interaction):
+        await self._show_page(interaction, self.page - 1)
+
+    async def _next_page(self, interaction: discord.Interaction):
+        await self._show_page(interaction, self.page + 1)
+
+    async def _enqueue_selected(self, interaction: discord.Interaction):
+        music_id = int(interaction.data['values'][0])
+        track = next((r for r in self.rows if r['id'] == music_id), None)
+        if track is None:
+            # The page changed between rendering the menu and the selection.
+            await interaction.response.send_message("This result is no longer available.", ephemeral=True)
+            return
+
+        auto_music = self.cog.bot.get_cog("AutoMusicCog")
+        if auto_music is None:
+            await interaction.response.send_message("Playback is not available right now.", ephemeral=True)
+            return
+        if not interaction.user.voice:
+            await interaction.response.send_message("You must be in a voice channel.", ephemeral=True)
+            return
+
+        await interaction.response.defer()
+        await auto_music.enqueue(interaction, [track['url']])
+        await interaction.followup.send(f"✅ Added **{track['name']}** to the queue.")
+        await auto_music.start_if_idle(interaction)
+
 
 class MusicCog(commands.Cog):
     """A cog for managing the music library in the database."""
@@ -90,6 +203,88 @@ class MusicCog(commands.Cog):
 
         return await asyncio.to_thread(_db_transaction)
 
+    async def _search_music(self, query: str, page: int) -> Tuple[int, List[Dict]]:
+        """
+        Runs a FULLTEXT search over music names and returns the total number of hits along with the requested page,
+        each row carrying its intensity and themes.
+        """
+        pool = getattr(self.bot, "db_pool", None)
+        if pool is None:
+            raise RuntimeError("Database connection pool not found on bot (bot.db_pool).")
+
+        boolean_query = _to_boolean_query(query)
+        offset = (page - 1) * SEARCH_PAGE_SIZE
+
+        def _query():
+            conn = pool.get_connection()
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    "SELECT COUNT(*) FROM musics WHERE MATCH(name) AGAINST (%s IN BOOLEAN MODE)",
+                    (boolean_query,)
+                )
+                total = cursor.fetchone()[0]
+
+                # Page over the index first, then only join themes for the handful of rows displayed.
+                cursor.execute(
+                    """
+                    SELECT m.id, m.name, m.url, m.intensity,
+                           GROUP_CONCAT(t.name ORDER BY t.name SEPARATOR ', ')
+                    FROM (SELECT id, name, url, intensity,
+                                 MATCH(name) AGAINST (%s IN BOOLEAN MODE) AS score
+                          FROM musics
+                          WHERE MATCH(name) AGAINST (%s IN BOOLEAN MODE)
+                          ORDER BY score DESC, name
+                          LIMIT %s OFFSET %s) m
+                             LEFT JOIN themes_list tl ON m.id = tl.music_id
+                             LEFT JOIN themes t ON tl.theme_id = t.id
+                    GROUP BY m.id, m.name, m.url, m.intensity, m.score
+                    ORDER BY m.score DESC, m.name
+                    """,
+                    (boolean_query, boolean_query, SEARCH_PAGE_SIZE, offset)
+                )
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+                conn.close()
+            return total, [{"id": r[0], "name": r[1], "url": r[2], "intensity": r[3], "themes": r[4]} for r in rows]
+
+        return await asyncio.to_thread(_query)
+
+    @app_commands.command(name="search_music", description="Searches the music library by name.")
+    @app_commands.describe(
+        query="Words contained in the music name.",
+        page="The page of results to show."
+    )
+    async def search_music(self, interaction: discord.Interaction, query: Range[str, 1, 100],
+                           page: Optional[Range[int, 1]] = 1):
+        await interaction.response.defer(ephemeral=True)
+        words = _search_words(query)
+        if not words:
+            await interaction.followup.send("Please provide at least one word to search for.")
+            return
+        if all(len(w) < MIN_SEARCH_TOKEN_LENGTH for w in words):
+            await interaction.followup.send(
+                f"Please include at least one word of {MIN_SEARCH_TOKEN_LENGTH} characters or more, "
+                f"shorter words are not indexed.")
+            return
+
+        try:
+            total, rows = await self._search_music(query, page)
+        except Exception as e:
+            await interaction.followup.send(f"A database error occurred: `{e}`")
+            return
+
+        if not rows:
+            if total:
+                await interaction.followup.send(f"Page **{page}** is out of range, there are only **{total}** result(s).")
+            else:
+                await interaction.followup.send(f"No music found matching '**{query}**'.")
+            return
+
+        view = SearchResultsView(self, query, page, total, rows)
+        view.message = await interaction.followup.send(embed=view.build_embed(), view=view)
+
     @app_commands.command(name="add_music", description="Adds a music track and links it to one or more themes.")
     @app_commands.describe(
         name="Name to register the music under.",
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+import os
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+from discord.app_commands import Range
+
+from diagnostics.profiler import capture_profile, MODE_SAMPLING, MODE_TRACING
+
+log = logging.getLogger(__name__)
+
+# Discord refuses attachments above this size for non-boosted guilds.
+MAX_ATTACHMENT_BYTES = 8 * 1024 * 1024
+
+
+class ProfilingCog(commands.Cog):
+    """Admin tools to capture a profile of the live bot."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.capture_lock = asyncio.Lock()
+
+    @app_commands.command(name="profile", description="Profiles the bot for a few seconds and sends back the report.")
+    @app_commands.describe(
+        seconds="How long to profile for.",
+        mode="Sampling is cheap and covers every thread, tracing is exact but slows the bot down while capturing.",
+        memory="Also trace memory allocations (slower while capturing)."
+    )
+    @app_commands.choices(mode=[
+        app_commands.Choice(name="sampling", value=MODE_SAMPLING),
+        app_commands.Choice(name="tracing (cProfile)", value=MODE_TRACING),
+    ])
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def profile(self, interaction: discord.Interaction, seconds: Range[int, 1, 120] = 10,
+                      mode: str = MODE_SAMPLING, memory: bool = False):
+        await interaction.response.defer(ephemeral=True)
+
+        if self.capture_lock.locked():
+            await interaction.followup.send("A profile is already being captured, please wait for it to finish.")
+            return
+
+        async with self.capture_lock:
+            try:
+                path = await capture_profile(seconds, mode=mode, trace_memory=memory)
+            except Exception as e:
+                log.exception("Profile capture failed")
+                await interaction.followup.send(f"❌ Profile capture failed: `{e}`")
+                return
+
+        if os.path.getsize(path) > MAX_ATTACHMENT_BYTES:
+            await interaction.followup.send(f"✅ Profile written to `{path}` (too large to attach).")
+        else:
+            await interaction.followup.send(f"✅ Profile written to `{path}`.", file=discord.File(path))
+
+    @profile.error
+    async def profile_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        if isinstance(error, app_commands.MissingPermissions):
+            await interaction.response.send_message("Only administrators can profile the bot.", ephemeral=True)
+        else:
+            raise error
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(ProfilingCog(bot))
@@ -39,3 +39,18 @@ def create_mariadb_pool(pool_name="bot_pool", pool_size: int = 5) -> mariadb.Con
     )
     return pool
 
+
+
+def ensure_music_search_index(pool: mariadb.ConnectionPool):
+    """
+    Create the FULLTEXT index backing /search_music if it does not exist yet.
+    Raises mariadb.Error on failure; caller should handle it.
+    """
+    conn = pool.get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("CREATE FULLTEXT INDEX IF NOT EXISTS ft_musics_name ON musics (name)")
+        conn.commit()
+    finally:
+        cursor.close()
+        conn.close()
@@ -0,0 +1,155 @@
+import asyncio
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+PROFILE_DIR = os.getenv('PROFILE_DIR', 'profiles')
+SAMPLE_INTERVAL_S = 0.005
+REPORT_TOP = 30
+
+
+def _describe(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """
+    Periodically samples the stack of every thread (event loop, voice players, buffer readers, DB workers)
+    from a dedicated thread. Nothing is installed when it is not running, so it costs nothing when disabled.
+    """
+
+    def __init__(self, interval_s: float = SAMPLE_INTERVAL_S):
+        self.interval_s = interval_s
+        self.samples = 0
+        self.self_counts = Counter()
+        self.total_counts = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+        self._thread.start()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        while not self._stop.wait(self.interval_s):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                thread_name = names.get(ident, str(ident))
+                self.self_counts[(thread_name, _describe(frame.f_code))] += 1
+
+                seen = set()
+                while frame is not None:
+                    key = (thread_name, _describe(frame.f_code))
+                    if key not in seen:
+                        seen.add(key)
+                        self.total_counts[key] += 1
+                    frame = frame.f_back
+            self.samples += 1
+
+    def report(self, top: int = REPORT_TOP) -> str:
+        lines = [f"{self.samples} samples every {self.interval_s * 1000:.0f}ms", ""]
+        for title, counts in (("Self samples", self.self_counts), ("Inclusive samples", self.total_counts)):
+            lines.append(f"--- {title} ---")
+            for (thread_name, function), count in counts.most_common(top):
+                share = 100 * count / self.samples if self.samples else 0
+                lines.append(f"{count:>7} {share:6.1f}%  [{thread_name}] {function}")
+            lines.append("")
+        return "\n".join(lines)
+
+
+MODE_SAMPLING = "sampling"
+MODE_TRACING = "tracing"
+
+# Since Python 3.12 cProfile is built on sys.monitoring and traces every thread, not only the one enabling it.
+TRACED_THREADS = "all threads" if sys.version_info >= (3, 12) else "event loop thread"
+
+
+async def capture_profile(seconds: float, mode: str = MODE_SAMPLING, trace_memory: bool = False) -> str:
+    """
+    Profiles the running bot for the given duration and writes the report to PROFILE_DIR.
+    The sampling mode periodically records the stacks of every thread at a low cost, while the tracing mode
+    runs cProfile, which is exact but slows down the traced threads. Both are never combined, so neither
+    measures the other. Optionally also records the top memory allocations made during the capture.
+    Returns the report path.
+    """
+    if mode not in (MODE_SAMPLING, MODE_TRACING):
+        raise ValueError(f"Unknown profiling mode: {mode}")
+
+    sampler = SamplingProfiler() if mode == MODE_SAMPLING else None
+    tracer = cProfile.Profile() if mode == MODE_TRACING else None
+    owns_tracemalloc = trace_memory and not tracemalloc.is_tracing()
+    memory_before = memory_after = None
+
+    started = time.perf_counter()
+    try:
+        if owns_tracemalloc:
+            tracemalloc.start()
+        if trace_memory:
+            memory_before = tracemalloc.take_snapshot()
+        if sampler is not None:
+            sampler.start()
+        if tracer is not None:
+            tracer.enable()
+
+        await asyncio.sleep(seconds)
+    finally:
+        if tracer is not None:
+            tracer.disable()
+        if sampler is not None and sampler.is_running:
+            sampler.stop()
+        # Snapshot before building any report, so the profiler's own allocations are not counted.
+        if trace_memory and tracemalloc.is_tracing() and memory_before is not None:
+            memory_after = tracemalloc.take_snapshot()
+        if owns_tracemalloc:
+            tracemalloc.stop()
+    elapsed = time.perf_counter() - started
+
+    report = io.StringIO()
+    report.write(f"Profile captured at {datetime.now().isoformat(timespec='seconds')} over {elapsed:.1f}s\n\n")
+    if sampler is not None:
+        report.write("=== Sampled stacks (all threads) ===\n")
+        report.write(sampler.report())
+    if tracer is not None:
+        report.write(f"=== cProfile ({TRACED_THREADS}) ===\n")
+        pstats.Stats(tracer, stream=report).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(REPORT_TOP)
+
+    if memory_after is not None:
+        # The sampler allocates while it runs, leave its own bookkeeping out of the diff.
+        own_allocations = [tracemalloc.Filter(False, __file__)]
+        memory_after = memory_after.filter_traces(own_allocations)
+        memory_before = memory_before.filter_traces(own_allocations)
+        report.write("\n=== Memory allocated during capture ===\n")
+        for stat in memory_after.compare_to(memory_before, "lineno")[:REPORT_TOP]:
+            report.write(f"{stat}\n")
+
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    path = os.path.join(PROFILE_DIR, f"profile_{datetime.now():%Y%m%d_%H%M%S}.txt")
+
+    def _write():
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(report.getvalue())
+
+    await asyncio.to_thread(_write)
+    return path